@@ -1,4 +1,4 @@
-from typing import List, Optional, Tuple, Union
+from typing import List, Optional, Sequence, Tuple, Union
 
 # Type aliases for Rust library types
 Pixel = int
@@ -8,23 +8,31 @@ Vector = Tuple[float, float]
 # Python 2D array type alias
 Matrix = List[List[float]]
 
+# Python 2D array-like initializer type alias
+MatrixLike = Sequence[Sequence[float]]
+
 class SpotShape:
-    def __init__(self, src: Union[None, float, Vector, Matrix] = None) -> None: ...
+    def __init__(self, src: Union[None, float, Vector, MatrixLike] = None) -> None: ...
     def scale(self, k: float) -> SpotShape: ...
     def stretch(self, kx: float, ky: float) -> SpotShape: ...
     def rotate(self, phi: float) -> SpotShape: ...
+    def matrix(self) -> Matrix: ...
 
 # Token class
 class SpotId:
     pass
 
 class Transform:
-    def __init__(self, src: Union[None, float, Vector, Matrix] = None) -> None: ...
+    IDENTITY: Transform = ...
+    def __init__(self, src: Union[None, float, Vector, MatrixLike] = None) -> None: ...
     def translate(self, shift: Vector) -> Transform: ...
     def scale(self, k: float) -> Transform: ...
     def stretch(self, kx: float, ky: float) -> Transform: ...
     def rotate(self, phi: float) -> Transform: ...
     def compose(self, t: Transform) -> Transform: ...
+    def compose_many(self, *ts: Transform) -> Transform: ...
+    def transform_points(self, points: Sequence[Point]) -> List[Point]: ...
+    def matrix(self) -> Matrix: ...
 
 class Window:
     def __init__(self, src: Tuple[Tuple[int, int], Tuple[int, int]]) -> None: ...
@@ -46,9 +54,18 @@ class Canvas:
     def add_spot(
         self, position: Point, shape: SpotShape, intensity: float
     ) -> SpotId: ...
+    def add_spots(
+        self,
+        positions: Sequence[Point],
+        shapes: Sequence[SpotShape],
+        intensities: Sequence[float],
+    ) -> List[SpotId]: ...
     def spot_position(self, spot: SpotId) -> Optional[Point]: ...
     def spot_intensity(self, spot: SpotId) -> Optional[float]: ...
     def set_spot_offset(self, spot: SpotId, offset: Vector) -> None: ...
+    def set_spot_offsets(
+        self, spots: Sequence[SpotId], offsets: Sequence[Vector]
+    ) -> None: ...
     def set_spot_illumination(self, spot: SpotId, illumination: float) -> None: ...
     def clear(self) -> None: ...
     def draw(self) -> None: ...
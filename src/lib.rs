@@ -3,7 +3,7 @@
 //! The Python bindings are implemented entirely in Rust using [`pyo3`].
 
 use pyo3::exceptions::{PyNotImplementedError, PyTypeError, PyValueError};
-use pyo3::types::PyBytes;
+use pyo3::types::{PyBytes, PyFloat, PyLong, PySequence, PyTuple};
 
 use pyo3::prelude::*;
 
@@ -60,6 +60,7 @@ struct SpotId(RsSpotId);
 /// The Python objects can be created as either:
 ///
 /// - `Transform()` -- the default identity transform
+/// - `Transform.IDENTITY` -- the shared identity transform object
 /// - `Transform((sx, sy))` -- the translation transform defined by a vector `(sx, sy)`
 /// - `Transform(k)` -- the scaling transform defined by a factor `k`
 /// - `Transform([[xx, xy], [yx, yy]])` -- explicit linear transform matrix initialization
@@ -154,25 +155,77 @@ struct ImageFormat(RsImageFormat);
 /// # Clear the canvas and paint the light spots.
 /// c.draw()
 /// ```
+///
+/// The GIL is released while drawing and exporting images, so
+/// independent `Canvas` objects can be rendered concurrently
+/// from multiple Python threads.
+///
+/// A `Canvas` object shared between threads must be externally
+/// synchronized, e.g. with a `threading.Lock`, otherwise the concurrent
+/// method calls fail with a `RuntimeError` while the object is borrowed.
 #[pyclass(module = "pyplanetarium")]
 struct Canvas(RsCanvas);
 
+/// Extracts a scalar value from a Python `float` or `int` object,
+/// including their subclasses such as `bool` and `numpy.float64`.
+///
+/// Returns `None` for the other object types without raising
+/// and discarding a Python exception.
+fn fast_extract_scalar(src: &PyAny) -> Option<f32> {
+    if let Ok(k) = src.downcast::<PyFloat>() {
+        Some(k.value() as f32)
+    } else if src.downcast::<PyLong>().is_ok() {
+        src.extract().ok()
+    } else {
+        None
+    }
+}
+
+/// Extracts a pair of scalar values from a Python 2-tuple
+/// of `float` or `int` objects or their subclasses.
+///
+/// Returns `None` for the other object types without raising
+/// and discarding a Python exception.
+fn fast_extract_pair(src: &PyAny) -> Option<(f32, f32)> {
+    let tuple = src.downcast::<PyTuple>().ok()?;
+    if tuple.len() != 2 {
+        return None;
+    }
+
+    let x = fast_extract_scalar(tuple.get_item(0).ok()?)?;
+    let y = fast_extract_scalar(tuple.get_item(1).ok()?)?;
+    Some((x, y))
+}
+
+/// Creates the `TypeError` exception for unsupported constructor arguments.
+fn initializer_type_error(src: &PyAny) -> PyErr {
+    let type_name = src.get_type().name().unwrap_or("<unknown>");
+    PyTypeError::new_err(format!("Unexpected initializer type: '{type_name}'"))
+}
+
 #[pymethods]
 impl SpotShape {
     #[new]
     fn new(src: Option<&PyAny>) -> PyResult<Self> {
         if let Some(src) = src {
-            if let Ok(k) = src.extract::<f32>() {
+            // Try the common cases first to avoid speculative extraction errors.
+            if let Some(k) = fast_extract_scalar(src) {
                 Ok(SpotShape(k.into()))
-            } else if let Ok(kxy) = src.extract::<(f32, f32)>() {
+            } else if let Some(kxy) = fast_extract_pair(src) {
                 Ok(SpotShape(kxy.into()))
-            } else if let Ok(mat) = src.extract::<Matrix>() {
-                Ok(SpotShape(mat.into()))
+            } else if src.downcast::<PySequence>().is_ok() {
+                // Sequences are never scalars, go straight to the matrix.
+                if let Ok(mat) = src.extract::<Matrix>() {
+                    Ok(SpotShape(mat.into()))
+                } else if let Ok(kxy) = src.extract::<(f32, f32)>() {
+                    Ok(SpotShape(kxy.into()))
+                } else {
+                    Err(initializer_type_error(src))
+                }
+            } else if let Ok(k) = src.extract::<f32>() {
+                Ok(SpotShape(k.into()))
             } else {
-                Err(PyTypeError::new_err(format!(
-                    "Unexpected initializer type: '{}'",
-                    src.get_type().name().unwrap()
-                )))
+                Err(initializer_type_error(src))
             }
         } else {
             Ok(SpotShape(RsSpotShape::default()))
@@ -194,6 +247,15 @@ impl SpotShape {
         SpotShape(self.0.rotate(phi))
     }
 
+    /// Returns the spot shape matrix as `[[xx, xy], [yx, yy]]`.
+    ///
+    /// The returned nested list can be passed back to the `SpotShape`
+    /// constructor or converted to an array with `numpy.array()`.
+    fn matrix(&self) -> Matrix {
+        let s = &self.0;
+        [[s.xx, s.xy], [s.yx, s.yy]]
+    }
+
     /// Implements `str(x)` in Python.
     fn __str__(&self) -> String {
         self.0.to_string()
@@ -220,22 +282,39 @@ impl SpotId {
 
 #[pymethods]
 impl Transform {
+    /// Identity transform singleton.
+    ///
+    /// Reusing this object instead of calling `Transform()`
+    /// avoids allocating a new identity transform object.
+    #[classattr]
+    #[allow(non_snake_case)]
+    fn IDENTITY() -> Transform {
+        Transform(RsTransform::default())
+    }
+
     #[new]
     fn new(src: Option<&PyAny>) -> PyResult<Self> {
         if let Some(src) = src {
-            if let Ok(k) = src.extract::<f32>() {
+            // Try the common cases first to avoid speculative extraction errors.
+            if let Some(k) = fast_extract_scalar(src) {
                 Ok(Transform(k.into()))
-            } else if let Ok(shift) = src.extract::<Vector>() {
+            } else if let Some(shift) = fast_extract_pair(src) {
                 Ok(Transform(shift.into()))
-            } else if let Ok(mat) = src.extract::<Matrix>() {
-                Ok(Transform(mat.into()))
-            } else if let Ok(mat) = src.extract::<Matrix23>() {
-                Ok(Transform(mat.into()))
+            } else if src.downcast::<PySequence>().is_ok() {
+                // Sequences are never scalars, go straight to the matrix.
+                if let Ok(mat) = src.extract::<Matrix>() {
+                    Ok(Transform(mat.into()))
+                } else if let Ok(mat) = src.extract::<Matrix23>() {
+                    Ok(Transform(mat.into()))
+                } else if let Ok(shift) = src.extract::<Vector>() {
+                    Ok(Transform(shift.into()))
+                } else {
+                    Err(initializer_type_error(src))
+                }
+            } else if let Ok(k) = src.extract::<f32>() {
+                Ok(Transform(k.into()))
             } else {
-                Err(PyTypeError::new_err(format!(
-                    "Unexpected initializer type: '{}'",
-                    src.get_type().name().unwrap()
-                )))
+                Err(initializer_type_error(src))
             }
         } else {
             Ok(Transform(RsTransform::default()))
@@ -265,8 +344,52 @@ impl Transform {
     /// Composes the coordinate transformation with an outer transformation.
     ///
     /// In the matrix multiplication form: `[t][self]`
-    fn compose(&self, t: &Transform) -> Transform {
-        Transform(self.0.compose(t.0))
+    ///
+    /// Composing with an identity transformation returns
+    /// the other operand object as is.
+    fn compose(slf: PyRef<'_, Self>, t: PyRef<'_, Self>) -> PyResult<Py<Transform>> {
+        if t.is_identity() {
+            Ok(slf.into())
+        } else if slf.is_identity() {
+            Ok(t.into())
+        } else {
+            Py::new(slf.py(), Transform(slf.0.compose(t.0)))
+        }
+    }
+
+    /// Composes the coordinate transformation with multiple outer transformations.
+    ///
+    /// Equivalent to chained `compose()` calls in the argument order.
+    /// In the matrix multiplication form: `[tN]...[t2][t1][self]`
+    #[pyo3(signature = (*ts))]
+    fn compose_many(&self, ts: &PyTuple) -> PyResult<Transform> {
+        let mut tr = self.0;
+        for t in ts {
+            let t: PyRef<Transform> = t.extract()?;
+            tr = tr.compose(t.0);
+        }
+
+        Ok(Transform(tr))
+    }
+
+    /// Applies the coordinate transformation to a sequence of points.
+    ///
+    /// Returns the list of the transformed point coordinates.
+    fn transform_points(&self, points: Vec<Point>) -> Vec<Point> {
+        let t = &self.0;
+        points
+            .into_iter()
+            .map(|(x, y)| (t.xx * x + t.xy * y + t.tx, t.yx * x + t.yy * y + t.ty))
+            .collect()
+    }
+
+    /// Returns the affine transform matrix as `[[xx, xy, tx], [yx, yy, ty]]`.
+    ///
+    /// The returned nested list can be passed back to the `Transform`
+    /// constructor or converted to an array with `numpy.array()`.
+    fn matrix(&self) -> Matrix23 {
+        let t = &self.0;
+        [[t.xx, t.xy, t.tx], [t.yx, t.yy, t.ty]]
     }
 
     /// Implements `str(x)` in Python.
@@ -280,6 +403,14 @@ impl Transform {
     }
 }
 
+impl Transform {
+    /// Checks if the transform matrix is exactly the identity matrix.
+    fn is_identity(&self) -> bool {
+        let t = &self.0;
+        t.xx == 1.0 && t.xy == 0.0 && t.yx == 0.0 && t.yy == 1.0 && t.tx == 0.0 && t.ty == 0.0
+    }
+}
+
 #[pymethods]
 impl Window {
     #[new]
@@ -372,6 +503,34 @@ impl Canvas {
         SpotId(id)
     }
 
+    /// Creates multiple new light spots on the canvas in a single call.
+    ///
+    /// The spot positions, shapes and intensities are passed as
+    /// equal length sequences. Returns the list of the new spot IDs.
+    fn add_spots(
+        &mut self,
+        positions: Vec<Point>,
+        shapes: Vec<PyRef<SpotShape>>,
+        intensities: Vec<f32>,
+    ) -> PyResult<Vec<SpotId>> {
+        if shapes.len() != positions.len() || intensities.len() != positions.len() {
+            return Err(PyValueError::new_err(
+                "spot parameter sequences differ in length".to_string(),
+            ));
+        }
+
+        let ids = positions
+            .into_iter()
+            .zip(shapes)
+            .zip(intensities)
+            .map(|((position, shape), intensity)| {
+                SpotId(self.0.add_spot(position, shape.0, intensity))
+            })
+            .collect();
+
+        Ok(ids)
+    }
+
     /// Calculates the canvas coordinates of the light spot.
     ///
     /// The canvas coordinates are calculated as the immutable spot position coordinates
@@ -398,6 +557,28 @@ impl Canvas {
         self.0.set_spot_offset(spot.0, offset);
     }
 
+    /// Sets the internal position offset vectors of multiple light spots.
+    ///
+    /// The spot IDs and the offset vectors are passed as
+    /// equal length sequences.
+    fn set_spot_offsets(
+        &mut self,
+        spots: Vec<PyRef<SpotId>>,
+        offsets: Vec<Vector>,
+    ) -> PyResult<()> {
+        if offsets.len() != spots.len() {
+            return Err(PyValueError::new_err(
+                "spot parameter sequences differ in length".to_string(),
+            ));
+        }
+
+        for (spot, offset) in spots.iter().zip(offsets) {
+            self.0.set_spot_offset(spot.0, offset);
+        }
+
+        Ok(())
+    }
+
     /// Sets the internal light spot illumination state.
     ///
     /// The spot illumination factor is multiplied with the immutable spot
@@ -412,8 +593,10 @@ impl Canvas {
     }
 
     /// Draws the light spots onto the canvas image.
-    fn draw(&mut self) {
-        self.0.draw();
+    ///
+    /// The GIL is released while drawing.
+    fn draw(&mut self, py: Python) {
+        py.allow_threads(|| self.0.draw());
     }
 
     /// Returns the canvas dimensions as `(width, height)`.
@@ -442,21 +625,25 @@ impl Canvas {
     }
 
     /// Exports the canvas contents in the requested image format.
+    ///
+    /// The GIL is released while encoding the image.
     fn export_image(&self, format: &ImageFormat, py: Python) -> PyResult<Py<PyBytes>> {
-        match self.0.export_image(format.0) {
+        match py.allow_threads(|| self.0.export_image(format.0)) {
             Ok(b) => Ok(PyBytes::new(py, b.as_slice()).into()),
             Err(e) => Err(my_to_pyerr(e)),
         }
     }
 
     /// Exports the canvas window contents in the requested image format.
+    ///
+    /// The GIL is released while encoding the image.
     fn export_window_image(
         &self,
         window: &Window,
         format: &ImageFormat,
         py: Python,
     ) -> PyResult<Py<PyBytes>> {
-        match self.0.export_window_image(window.0, format.0) {
+        match py.allow_threads(|| self.0.export_window_image(window.0, format.0)) {
             Ok(b) => Ok(PyBytes::new(py, b.as_slice()).into()),
             Err(e) => Err(my_to_pyerr(e)),
         }
@@ -466,13 +653,15 @@ impl Canvas {
     ///
     /// The integer subsampling factors in X and Y directions
     /// are passed in `factors`.
+    ///
+    /// The GIL is released while encoding the image.
     fn export_subsampled_image(
         &self,
         factors: (u32, u32),
         format: &ImageFormat,
         py: Python,
     ) -> PyResult<Py<PyBytes>> {
-        match self.0.export_subsampled_image(factors, format.0) {
+        match py.allow_threads(|| self.0.export_subsampled_image(factors, format.0)) {
             Ok(b) => Ok(PyBytes::new(py, b.as_slice()).into()),
             Err(e) => Err(my_to_pyerr(e)),
         }
@@ -2,11 +2,59 @@
 pyplanetarium package integration tests
 """
 
+import struct
+import threading
 import unittest
+import zlib
+
+from typing import List, Optional, Tuple
 
 from pyplanetarium import SpotShape, SpotId, Transform, Canvas, ImageFormat, Window
 
 
+def png_info(
+    png_bytes: bytes, pixel_bits: Optional[int] = None
+) -> Tuple[int, int, int, int]:
+    """
+    Decodes the grayscale PNG image header and the first pixel value
+
+    Returns `(width, height, bit_depth, first_pixel)`.
+
+    When `pixel_bits` is given, the first pixel value is truncated
+    to `pixel_bits` of precision to match the RAW image formats.
+
+    The first pixel of the first scanline is stored verbatim
+    with any of the PNG filter types, so the value does not
+    depend on the encoder compression or filtering settings.
+    """
+
+    assert png_bytes[:8] == b"\x89PNG\r\n\x1a\n"
+
+    header = b""
+    idat = b""
+    pos = 8
+    while pos < len(png_bytes):
+        (length,) = struct.unpack(">I", png_bytes[pos : pos + 4])
+        chunk_type = png_bytes[pos + 4 : pos + 8]
+        chunk_data = png_bytes[pos + 8 : pos + 8 + length]
+        if chunk_type == b"IHDR":
+            header = chunk_data
+        elif chunk_type == b"IDAT":
+            idat += chunk_data
+        pos += length + 12
+
+    width, height, bit_depth = struct.unpack(">IIB", header[:9])
+
+    data = zlib.decompress(idat)
+    # Skip the scanline filter type byte.
+    first_pixel = int.from_bytes(data[1 : 1 + bit_depth // 8], "big")
+
+    if pixel_bits is not None:
+        first_pixel >>= bit_depth - pixel_bits
+
+    return width, height, bit_depth, first_pixel
+
+
 class CanvasCase(unittest.TestCase):
     """
     pyplanetarium.Canvas class unit tests
@@ -147,6 +195,71 @@ class CanvasCase(unittest.TestCase):
 
         canvas.draw()
 
+    def test_batch_spots(self) -> None:
+        """
+        Batched light spots adding and moving test
+        """
+
+        shape1 = SpotShape().scale(3.5)
+        shape2 = SpotShape(5.5).stretch(1.0, 1.5).rotate(30)
+
+        canvas = Canvas.new(1024, 768)
+        spot0 = canvas.add_spot((10.5, 20.5), shape1, 0.5)
+
+        spots = canvas.add_spots(
+            [(100.5, 200.7), (400.5, 600.7)], [shape1, shape2], [0.8, 0.6]
+        )
+        self.assertEqual(len(spots), 2)
+        self.assertEqual(repr(spots[0]), "SpotId(1)")
+        self.assertEqual(repr(spots[1]), "SpotId(2)")
+
+        pos2 = canvas.spot_position(spots[1])
+        assert pos2 is not None
+        self.assertAlmostEqual(pos2[0], 400.5, 4)
+        self.assertAlmostEqual(pos2[1], 600.7, 4)
+
+        int1 = canvas.spot_intensity(spots[0])
+        assert int1 is not None
+        self.assertAlmostEqual(int1, 0.8, 4)
+
+        self.assertEqual(canvas.add_spots([], [], []), [])
+
+        canvas.set_spot_offsets([spot0, spots[1]], [(1.5, 2.0), (5.5, -7.0)])
+
+        pos0 = canvas.spot_position(spot0)
+        pos2 = canvas.spot_position(spots[1])
+        assert pos0 is not None
+        assert pos2 is not None
+        self.assertAlmostEqual(pos0[0], 10.5 + 1.5, 4)
+        self.assertAlmostEqual(pos0[1], 20.5 + 2.0, 4)
+        self.assertAlmostEqual(pos2[0], 400.5 + 5.5, 4)
+        self.assertAlmostEqual(pos2[1], 600.7 - 7.0, 4)
+
+        canvas.draw()
+
+    def test_batch_spots_error(self) -> None:
+        """
+        Batched light spots parameter errors test
+        """
+
+        canvas = Canvas.new(100, 100)
+        spot = canvas.add_spot((1.0, 1.0), SpotShape(), 0.8)
+
+        with self.assertRaises(ValueError):
+            canvas.add_spots([(1.0, 1.0), (2.0, 2.0)], [SpotShape()], [0.5, 0.5])
+
+        with self.assertRaises(ValueError):
+            canvas.add_spots([(1.0, 1.0)], [SpotShape()], [0.5, 0.5])
+
+        with self.assertRaises(TypeError):
+            canvas.add_spots([(1.0, 1.0)], [1.0], [0.5])  # type: ignore
+
+        with self.assertRaises(ValueError):
+            canvas.set_spot_offsets([spot], [(1.0, 1.0), (2.0, 2.0)])
+
+        with self.assertRaises(TypeError):
+            canvas.set_spot_offsets([0], [(1.0, 1.0)])  # type: ignore
+
     def test_view_transform(self) -> None:
         """
         Setting the canvas view transform test
@@ -204,6 +317,32 @@ class CanvasCase(unittest.TestCase):
 
         canvas.draw()
 
+    def test_draw_threads(self) -> None:
+        """
+        Multithreaded canvas drawing and image export smoke test
+        """
+
+        canvases = [Canvas.new(256, 256) for _ in range(4)]
+        for canvas in canvases:
+            canvas.add_spot((180.5, 150.7), SpotShape().scale(3.5), 0.8)
+            canvas.set_background(5000)
+
+        results: List[bytes] = []
+
+        def render(canvas: Canvas) -> None:
+            canvas.draw()
+            results.append(canvas.export_image(ImageFormat.RawGamma8Bpp))
+
+        threads = [threading.Thread(target=render, args=(c,)) for c in canvases]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(results), len(canvases))
+        for raw8_bytes in results:
+            self.assertEqual(raw8_bytes, results[0])
+
     def test_spot_hash(self) -> None:
         """
         Opaque spot identifiers as dict keys test
@@ -265,11 +404,16 @@ class CanvasCase(unittest.TestCase):
 
         png8_bytes = canvas.export_image(ImageFormat.PngGamma8Bpp)
         self.assertIsInstance(png8_bytes, bytes)
-        self.assertEqual(len(png8_bytes), 1301)
+        self.assertLess(len(png8_bytes), len(raw8_bytes))
+        self.assertEqual(png_info(png8_bytes), (width, height, 8, raw8_bytes[0]))
 
         png16_bytes = canvas.export_image(ImageFormat.PngLinear16Bpp)
         self.assertIsInstance(png16_bytes, bytes)
-        self.assertEqual(len(png16_bytes), 2743)
+        self.assertLess(len(png16_bytes), len(raw10_bytes))
+        self.assertEqual(
+            png_info(png16_bytes, 10),
+            (width, height, 16, int.from_bytes(raw10_bytes[:2], "little")),
+        )
 
         # with open("image8.raw", "wb") as f:
         #     f.write(raw8_bytes)
@@ -325,11 +469,16 @@ class CanvasCase(unittest.TestCase):
 
         png8_bytes = canvas.export_window_image(wnd1, ImageFormat.PngGamma8Bpp)
         self.assertIsInstance(png8_bytes, bytes)
-        self.assertEqual(len(png8_bytes), 256)
+        self.assertLess(len(png8_bytes), len(raw8_bytes))
+        self.assertEqual(png_info(png8_bytes), (32, 16, 8, raw8_bytes[0]))
 
         png16_bytes = canvas.export_window_image(wnd2, ImageFormat.PngLinear16Bpp)
         self.assertIsInstance(png16_bytes, bytes)
-        self.assertEqual(len(png16_bytes), 670)
+        self.assertLess(len(png16_bytes), len(raw12_bytes))
+        self.assertEqual(
+            png_info(png16_bytes, 12),
+            (32, 16, 16, int.from_bytes(raw12_bytes[:2], "little")),
+        )
 
     def test_export_subsampled_images(self) -> None:
         """
@@ -371,11 +520,16 @@ class CanvasCase(unittest.TestCase):
 
         png8_bytes = canvas.export_subsampled_image((2, 2), ImageFormat.PngGamma8Bpp)
         self.assertIsInstance(png8_bytes, bytes)
-        self.assertEqual(len(png8_bytes), 430)
+        self.assertLess(len(png8_bytes), len(raw8_bytes))
+        self.assertEqual(png_info(png8_bytes), (128, 128, 8, raw8_bytes[0]))
 
         png16_bytes = canvas.export_subsampled_image((4, 4), ImageFormat.PngLinear16Bpp)
         self.assertIsInstance(png16_bytes, bytes)
-        self.assertEqual(len(png16_bytes), 309)
+        self.assertLess(len(png16_bytes), len(raw12_bytes))
+        self.assertEqual(
+            png_info(png16_bytes, 12),
+            (64, 64, 16, int.from_bytes(raw12_bytes[:2], "little")),
+        )
 
     def test_export_window_error(self) -> None:
         """
@@ -57,6 +57,22 @@ class ShapeCase(unittest.TestCase):
         shape8 = SpotShape([[3, 0], [0, 2]])
         self.assertIsInstance(shape8, SpotShape)
 
+        shape9 = SpotShape(((3.5, 0.5), (-0.5, 2.5)))
+        self.assertEqual(str(shape9), "[[3.5, 0.5], [-0.5, 2.5]]")
+
+    def test_matrix(self) -> None:
+        """
+        SpotShape matrix export test
+        """
+
+        self.assertEqual(SpotShape().matrix(), [[1.0, 0.0], [0.0, 1.0]])
+        self.assertEqual(SpotShape((3.5, 2.5)).matrix(), [[3.5, 0.0], [0.0, 2.5]])
+
+        mat = [[3.5, 0.5], [-0.5, 2.5]]
+        shape = SpotShape(mat)
+        self.assertEqual(shape.matrix(), mat)
+        self.assertEqual(repr(SpotShape(shape.matrix())), repr(shape))
+
     def test_init_err(self) -> None:
         """
         SpotShape instantiation errors test
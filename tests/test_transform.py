@@ -4,7 +4,7 @@ pyplanetarium package integration tests
 
 import unittest
 
-from pyplanetarium import Transform
+from pyplanetarium import Canvas, SpotShape, Transform
 
 
 class TransformCase(unittest.TestCase):
@@ -60,6 +60,61 @@ class TransformCase(unittest.TestCase):
         tr10 = Transform([[3, 0, 10], [0, 2, 5]])
         self.assertIsInstance(tr10, Transform)
 
+        tr11 = Transform(((3.5, 0.5, 5.25), (-0.5, 2.5, -14.75)))
+        self.assertEqual(str(tr11), "[[3.5, 0.5, 5.25], [-0.5, 2.5, -14.75]]")
+
+    def test_transform_points(self) -> None:
+        """
+        Transform points coordinates transformation test
+        """
+
+        tr1 = Transform((-100, 200)).rotate(45).compose(Transform([[-1, 0], [0, 1]]))
+        points = [(100.5, 200.25), (400.5, 600.75), (0.0, 0.0)]
+
+        tr_points = tr1.transform_points(points)
+        self.assertEqual(len(tr_points), len(points))
+
+        canvas = Canvas.new(10, 10)
+        canvas.set_view_transform(tr1)
+        for point, tr_point in zip(points, tr_points):
+            pos = canvas.spot_position(canvas.add_spot(point, SpotShape(), 1.0))
+            assert pos is not None
+            self.assertAlmostEqual(tr_point[0], pos[0], 4)
+            self.assertAlmostEqual(tr_point[1], pos[1], 4)
+
+        self.assertEqual(Transform((3.5, 2.5)).transform_points([(1, 2)]), [(4.5, 4.5)])
+        self.assertEqual(tr1.transform_points([]), [])
+
+    def test_matrix(self) -> None:
+        """
+        Transform matrix export test
+        """
+
+        self.assertEqual(Transform().matrix(), [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0]])
+        self.assertEqual(
+            Transform((3.5, 2.5)).matrix(), [[1.0, 0.0, 3.5], [0.0, 1.0, 2.5]]
+        )
+
+        mat = [[3.5, 0.5, 5.25], [-0.5, 2.5, -14.75]]
+        tr1 = Transform(mat)
+        self.assertEqual(tr1.matrix(), mat)
+
+        tr2 = tr1.rotate(30).translate((1.5, -2.5))
+        self.assertEqual(repr(Transform(tr2.matrix())), repr(tr2))
+
+    def test_identity(self) -> None:
+        """
+        Identity transform singleton test
+        """
+
+        tr1 = Transform.IDENTITY
+        self.assertIsInstance(tr1, Transform)
+        self.assertIs(tr1, Transform.IDENTITY)
+        self.assertEqual(repr(tr1), repr(Transform()))
+
+        tr2 = Transform(3.5).translate((5.25, -14.75))
+        self.assertIs(tr2.compose(Transform.IDENTITY), tr2)
+
     def test_init_err(self) -> None:
         """
         Transform instantiation errors test
@@ -127,6 +182,40 @@ class TransformCase(unittest.TestCase):
         tr8 = tr7.compose(tr3).compose(Transform())
         self.assertIsInstance(tr8, Transform)
 
+    def test_compose_identity(self) -> None:
+        """
+        Transform composition with identity test
+        """
+
+        tr1 = Transform((5.0, -10.0)).scale(2.0).rotate(45)
+        tr2 = Transform()
+
+        self.assertIs(tr1.compose(tr2), tr1)
+        self.assertIs(tr2.compose(tr1), tr1)
+        self.assertIs(tr2.compose(Transform()), tr2)
+
+        tr3 = tr1.compose(Transform(2.0))
+        self.assertIsNot(tr3, tr1)
+        self.assertEqual(str(tr3), str(tr1.scale(2.0)))
+
+    def test_compose_many(self) -> None:
+        """
+        Transform multiple composition test
+        """
+
+        tr1 = Transform((5.0, -10.0)).scale(2.0).rotate(45)
+        tr2 = Transform(2.5).translate((5.5, -4.25))
+        tr3 = Transform([[3.5, 0.5, 5.25], [-0.5, 2.5, -14.75]])
+
+        tr4 = tr1.compose_many(tr2, tr3)
+        self.assertEqual(repr(tr4), repr(tr1.compose(tr2).compose(tr3)))
+
+        tr5 = tr1.compose_many()
+        self.assertEqual(repr(tr5), repr(tr1))
+
+        with self.assertRaises(TypeError):
+            tr1.compose_many(tr2, 1.0)  # type: ignore
+
 
 if __name__ == "__main__":
     unittest.main()